@@ -6,20 +6,32 @@ Date: January 14, 2026
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Dict, Any, Tuple
 from seleniumbase import Driver
+from seleniumbase.fixtures import js_utils
 from selenium import webdriver  # For LambdaTest RemoteWebDriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (
+    WebDriverException,
+    TimeoutException,
+    StaleElementReferenceException,
+)
+import asyncio
+import base64
+import concurrent.futures
+import queue
+import threading
 import time
 import os
 import uuid
-import requests
+import httpx
+import orjson
+import urllib3
 from datetime import datetime
 import traceback
 import logging
+import weakref
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,7 +41,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Python Bridge API",
     description="Production-ready Selenium automation bridge for n8n",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -43,10 +56,15 @@ app.add_middleware(
 
 # Pydantic Models for JSON Schema
 class TestStep(BaseModel):
+    # Steps are read-only once parsed; frozen enables Pydantic's fast
+    # attribute path
+    model_config = ConfigDict(frozen=True)
+
     action: str = Field(..., description="Action to perform: open_url, click, type_text, verify, wait, screenshot")
     selector: Optional[str] = Field(None, description="CSS selector for the element")
     value: Optional[str] = Field(None, description="Value for type or verify actions")
     timeout: Optional[int] = Field(10, description="Timeout in seconds")
+    retries: Optional[int] = Field(None, ge=0, description="Retry count override; defaults depend on the action")
     description: Optional[str] = Field(None, description="Human-readable description of the step")
 
 class TestRequest(BaseModel):
@@ -69,28 +87,235 @@ class TestResult(BaseModel):
     timestamp: str
     detailed_results: List[Dict[str, Any]]
 
-# Global driver management (session-based)
-active_drivers: Dict[str, Driver] = {}
+# Global driver management (session-based). Weak values so a crashed
+# cleanup path can't keep a dead driver alive through this registry.
+active_drivers: "weakref.WeakValueDictionary[str, Driver]" = weakref.WeakValueDictionary()
+
+# Pre-warmed driver pool, keyed by (browser, headless).
+# Chrome startup with undetected-chromedriver takes several seconds, so
+# drivers are reused across tests instead of being spawned per request.
+# Each configuration gets its own semaphore so MAX_POOL_SIZE bounds the
+# live drivers per key, idle ones included.
+MAX_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "2"))
+driver_pool: Dict[Tuple[str, bool], "asyncio.Queue[Driver]"] = {}
+driver_slots: Dict[Tuple[str, bool], asyncio.Semaphore] = {}
+
+# Bounded worker pool for blocking Selenium calls, so slow tests
+# don't stall the event loop (or each other's /health checks)
+MAX_PARALLEL_TESTS = int(os.getenv("MAX_PARALLEL_TESTS", "4"))
+test_executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_PARALLEL_TESTS)
+
+# Shared HTTP client for webhook callbacks (keep-alive connection pool)
+http_client: Optional[httpx.AsyncClient] = None
+
+@app.on_event("startup")
+async def _create_http_client():
+    """Create the shared webhook client once so connections are reused."""
+    global http_client
+    http_client = httpx.AsyncClient(
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=100),
+        headers={"Connection": "keep-alive"}
+    )
+
+@app.on_event("shutdown")
+async def _close_http_client():
+    """Close the shared webhook client on server shutdown."""
+    if http_client:
+        await http_client.aclose()
+
+def _widen_command_executor_pool(driver: Driver):
+    """Raise the driver's urllib3 pool size so concurrent WebDriver
+    commands (e.g. a screenshot while a wait is polling) don't serialize
+    on the default maxsize=1 connection pool."""
+    try:
+        driver.command_executor._conn = urllib3.PoolManager(num_pools=10, maxsize=20)
+    except Exception as e:
+        logger.warning(f"Could not widen command executor pool: {str(e)}")
+
+def _get_pool(browser: str, headless: bool) -> "asyncio.Queue[Driver]":
+    """Get (or lazily create) the driver queue for a browser configuration."""
+    key = (browser, headless)
+    if key not in driver_pool:
+        driver_pool[key] = asyncio.Queue(maxsize=MAX_POOL_SIZE)
+        driver_slots[key] = asyncio.Semaphore(MAX_POOL_SIZE)
+    return driver_pool[key]
+
+def _get_slots(browser: str, headless: bool) -> asyncio.Semaphore:
+    """Get the driver-count semaphore for a browser configuration."""
+    _get_pool(browser, headless)
+    return driver_slots[(browser, headless)]
+
+async def _acquire_driver(browser: str, headless: bool) -> Driver:
+    """Check a driver out of the pool, creating one if none is idle."""
+    slots = _get_slots(browser, headless)
+    await slots.acquire()
+    pool = _get_pool(browser, headless)
+    try:
+        driver = pool.get_nowait()
+        logger.info(f"Reusing pooled driver ({browser}, headless={headless})")
+        return driver
+    except asyncio.QueueEmpty:
+        pass
+    logger.info(f"Creating new driver ({browser}, headless={headless})")
+    try:
+        driver = await asyncio.to_thread(
+            Driver,
+            browser=browser,
+            headless=headless,
+            uc=True,  # Use undetected-chromedriver
+            page_load_strategy="normal"
+        )
+    except BaseException:
+        # Give the slot back on a failed launch, or repeated failures
+        # would leave the semaphore drained and block every request
+        slots.release()
+        raise
+    _widen_command_executor_pool(driver)
+    return driver
+
+async def _release_driver(driver: Driver, browser: str, headless: bool, healthy: bool = True):
+    """Return a driver to the pool after resetting its state, or quit it."""
+    try:
+        if healthy:
+            await asyncio.to_thread(driver.delete_all_cookies)
+            await asyncio.to_thread(driver.get, "about:blank")
+            _get_pool(browser, headless).put_nowait(driver)
+            return
+    except Exception as e:
+        logger.warning(f"Driver reset failed, quitting instead of pooling: {str(e)}")
+    finally:
+        _get_slots(browser, headless).release()
+    try:
+        await asyncio.to_thread(driver.quit)
+    except Exception as e:
+        logger.error(f"Error closing driver: {str(e)}")
+
+# Drivers pre-spawned at startup so the first request doesn't pay the
+# 2-5s Chrome launch; tune to host CPU/RAM via env
+WARM_DRIVERS = int(os.getenv("WARM_DRIVERS", "1"))
+
+@app.on_event("startup")
+async def _warm_driver_pool():
+    """Pre-spawn headless Chrome drivers into the pool."""
+    pool = _get_pool("chrome", True)
+    for _ in range(min(WARM_DRIVERS, MAX_POOL_SIZE)):
+        try:
+            driver = await asyncio.to_thread(
+                Driver,
+                browser="chrome",
+                headless=True,
+                uc=True,  # Use undetected-chromedriver
+                page_load_strategy="normal"
+            )
+            _widen_command_executor_pool(driver)
+            pool.put_nowait(driver)
+            logger.info("Warm driver added to pool (chrome, headless=True)")
+        except Exception as e:
+            logger.warning(f"Driver warmup failed: {str(e)}")
+            break
+
+@app.on_event("shutdown")
+async def _drain_driver_pool():
+    """Quit every pooled driver on server shutdown."""
+    for pool in driver_pool.values():
+        while not pool.empty():
+            try:
+                pool.get_nowait().quit()
+            except Exception as e:
+                logger.error(f"Error closing pooled driver: {str(e)}")
 
 # Create screenshots directory
 SCREENSHOTS_DIR = "screenshots"
 os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
 
+# Screenshots are PNG-encoded in memory on the test thread and written
+# to disk by a dedicated writer thread, keeping disk latency out of the
+# step loop
+screenshot_queue: "queue.Queue[Tuple[str, bytes]]" = queue.Queue()
+
+def _screenshot_writer():
+    """Drain the screenshot queue in batches and write files to disk."""
+    while True:
+        items = [screenshot_queue.get()]
+        while len(items) < 32:
+            try:
+                items.append(screenshot_queue.get_nowait())
+            except queue.Empty:
+                break
+        for path, data in items:
+            try:
+                with open(path, "wb") as f:
+                    f.write(data)
+            except OSError as e:
+                logger.error(f"Failed to write screenshot {path}: {str(e)}")
+
+threading.Thread(target=_screenshot_writer, daemon=True, name="screenshot-writer").start()
+
+def _grab_screenshot(driver: Driver) -> Tuple[str, bytes]:
+    """Capture a viewport-only JPEG via CDP, falling back to a PNG.
+
+    JPEG at quality 70 is typically 5-10x smaller than the default
+    full-page PNG, cutting both in-browser encode time and disk I/O.
+    Returns (file extension, image bytes).
+    """
+    try:
+        b64 = driver.execute_cdp_cmd(
+            "Page.captureScreenshot",
+            {"format": "jpeg", "quality": 70, "captureBeyondViewport": False}
+        )["data"]
+        return ".jpg", base64.b64decode(b64)
+    except Exception as e:
+        logger.warning(f"CDP screenshot failed, falling back to PNG: {str(e)}")
+        return ".png", driver.get_screenshot_as_png()
+
 # ============= CORE EXECUTION ENGINE =============
 
 class SeleniumExecutor:
     """Atomic executor for Selenium commands with built-in retry and error handling."""
-    
+
+    # Default retry counts per action: deterministic actions (wait,
+    # screenshot) gain nothing from retries, network-touching ones do
+    _RETRIES = {"wait": 0, "screenshot": 0, "open_url": 1, "click": 2, "type_text": 2, "verify": 2}
+
     def __init__(self, driver: Driver, test_id: str):
         self.driver = driver
         self.test_id = test_id
         self.step_results = []
-        
+        # Located elements, keyed by selector, so consecutive steps on
+        # the same element skip the findElement round-trip
+        self.element_cache: Dict[str, Any] = {}
+        # Constant-time action dispatch instead of an if/elif chain
+        self._dispatch = {
+            "open_url": self._do_open_url,
+            "click": self._do_click,
+            "type_text": self._do_type_text,
+            "verify": self._do_verify,
+            "wait": self._do_wait,
+            "screenshot": self._do_screenshot,
+        }
+
+    def _get(self, selector: str, timeout: int):
+        """Return a cached WebElement for the selector, locating it if needed."""
+        element = self.element_cache.get(selector)
+        if element is None:
+            element = self.driver.wait_for_element(selector, timeout=timeout)
+            self.element_cache[selector] = element
+        return element
+
+    def _with_element(self, selector: str, timeout: int, action):
+        """Run action(element), re-locating once if the cached element went stale."""
+        try:
+            return action(self._get(selector, timeout))
+        except StaleElementReferenceException:
+            self.element_cache.pop(selector, None)
+            return action(self._get(selector, timeout))
+
     def execute_step(self, step: TestStep, step_number: int) -> Dict[str, Any]:
-        """Execute a single atomic step with retry logic."""
-        max_retries = 2
+        """Execute a single atomic step, retrying transient Selenium failures."""
+        max_retries = step.retries if step.retries is not None else self._RETRIES.get(step.action, 2)
         retry_delay = 2
-        
+
         for attempt in range(max_retries + 1):
             try:
                 result = self._execute_action(step, step_number)
@@ -98,96 +323,175 @@ class SeleniumExecutor:
                 result['status'] = 'passed'
                 logger.info(f"Step {step_number} passed: {step.action}")
                 return result
-                
-            except Exception as e:
+
+            except (ValueError, AssertionError) as e:
+                # Malformed steps and failed assertions are deterministic -
+                # retrying would just repeat the same failure
+                logger.error(f"Step {step_number} failed: {str(e)}")
+                return self._record_failure(step, step_number, e, attempt + 1)
+
+            except (TimeoutException, StaleElementReferenceException, WebDriverException) as e:
                 if attempt < max_retries:
                     logger.warning(f"Step {step_number} failed (attempt {attempt + 1}/{max_retries + 1}): {str(e)}. Retrying...")
-                    time.sleep(retry_delay)
+                    time.sleep(retry_delay * 2 ** attempt)
                 else:
-                    # Final attempt failed - take screenshot
-                    screenshot_path = self._capture_failure_screenshot(step_number)
-                    result = {
-                        'step_number': step_number,
-                        'action': step.action,
-                        'status': 'failed',
-                        'error': str(e),
-                        'error_type': type(e).__name__,
-                        'screenshot': screenshot_path,
-                        'attempt': attempt + 1,
-                        'timestamp': datetime.now().isoformat()
-                    }
                     logger.error(f"Step {step_number} failed after {max_retries + 1} attempts: {str(e)}")
-                    return result
-        
+                    return self._record_failure(step, step_number, e, attempt + 1)
+
+            except Exception as e:
+                # Anything else (TypeError from bad step data, etc.) fails
+                # the step without retrying instead of aborting the test
+                logger.error(f"Step {step_number} failed: {str(e)}")
+                return self._record_failure(step, step_number, e, attempt + 1)
+
+    def _record_failure(self, step: TestStep, step_number: int, error: Exception, attempt: int) -> Dict[str, Any]:
+        """Build the failure result for a step, including a screenshot."""
+        screenshot_path = self._capture_failure_screenshot(step_number)
+        return {
+            'step_number': step_number,
+            'action': step.action,
+            'status': 'failed',
+            'error': str(error),
+            'error_type': type(error).__name__,
+            'screenshot': screenshot_path,
+            'attempt': attempt,
+            'timestamp': datetime.now().isoformat(timespec='milliseconds')
+        }
+
     def _execute_action(self, step: TestStep, step_number: int) -> Dict[str, Any]:
-        """Execute the actual Selenium action."""
+        """Execute the actual Selenium action via the dispatch table."""
         start_time = time.time()
-        
-        if step.action == "open_url":
-            url = step.value or step.selector
-            self.driver.get(url)
-            # Wait for page to load completely
-            time.sleep(1)  # Simple wait for page load            
-        elif step.action == "click":
-            if not step.selector:
-                raise ValueError("Selector is required for click action")
-            WebDriverWait(self.driver, step.timeout or 10).until(EC.visibility_of_element_located((By.CSS_SELECTOR, step.selector)))
-            self.driver.click(step.selector)
-            
-        elif step.action == "type_text":
-            if not step.selector or not step.value:
-                raise ValueError("Selector and value are required for type_text action")
-            WebDriverWait(self.driver, step.timeout or 10).until(EC.visibility_of_element_located((By.CSS_SELECTOR, step.selector)))
-            self.driver.type(step.selector, step.value)
-            
-        elif step.action == "verify":
-            if not step.selector:
-                raise ValueError("Selector is required for verify action")
-            element = WebDriverWait(self.driver, step.timeout or 10).until(EC.visibility_of_element_located((By.CSS_SELECTOR, step.selector)))
-            if step.value:
-                element_text = element.text
-                if step.value not in element_text:
-                    raise AssertionError(f"Expected '{step.value}' not found in element text: '{element_text}'")
-                    
-        elif step.action == "wait":
-            wait_time = int(step.value) if step.value else step.timeout
-            time.sleep(wait_time)
-            
-        elif step.action == "screenshot":
-            screenshot_path = f"{SCREENSHOTS_DIR}/{self.test_id}_step_{step_number}.png"
-            self.driver.save_screenshot(screenshot_path)
-            return {
-                'step_number': step_number,
-                'action': step.action,
-                'screenshot': screenshot_path,
-                'duration': time.time() - start_time,
-                'timestamp': datetime.now().isoformat()
-            }
-            
-        else:
-            raise ValueError(f"Unknown action: {step.action}")
-        
+
+        # Unpack Pydantic attributes once; locals are much cheaper than
+        # repeated model attribute lookups in the hot loop
+        action = step.action
+        handler = self._dispatch.get(action)
+        if handler is None:
+            raise ValueError(f"Unknown action: {action}")
+
+        result = handler(step, step_number, start_time)
+        if result is not None:
+            return result
+
         duration = time.time() - start_time
         return {
             'step_number': step_number,
-            'action': step.action,
+            'action': action,
             'selector': step.selector,
             'value': step.value,
             'duration': duration,
-            'timestamp': datetime.now().isoformat()
+            # Reuse the step start time; millisecond precision is plenty
+            'timestamp': datetime.fromtimestamp(start_time).isoformat(timespec='milliseconds')
+        }
+
+    # --- Action handlers (one per step.action) ---
+
+    def _do_open_url(self, step: TestStep, step_number: int, start_time: float):
+        url = step.value or step.selector
+        self.driver.get(url)
+        # Navigation invalidates every previously located element
+        self.element_cache.clear()
+        # Wait for the DOM to be ready instead of a fixed sleep
+        js_utils.wait_for_ready_state_complete(self.driver, step.timeout or 10)
+
+    def _do_click(self, step: TestStep, step_number: int, start_time: float):
+        selector = step.selector
+        if not selector:
+            raise ValueError("Selector is required for click action")
+        self._with_element(selector, step.timeout or 10, lambda element: element.click())
+
+    def _do_type_text(self, step: TestStep, step_number: int, start_time: float):
+        selector, value = step.selector, step.value
+        if not selector or not value:
+            raise ValueError("Selector and value are required for type_text action")
+
+        def type_into(element):
+            element.clear()
+            element.send_keys(value)
+
+        self._with_element(selector, step.timeout or 10, type_into)
+
+    def _do_verify(self, step: TestStep, step_number: int, start_time: float):
+        selector, expected = step.selector, step.value
+        if not selector:
+            raise ValueError("Selector is required for verify action")
+        element_text = self._with_element(selector, step.timeout or 10, lambda element: element.text)
+        if expected:
+            if expected not in element_text:
+                raise AssertionError(f"Expected '{expected}' not found in element text: '{element_text}'")
+
+    def _do_wait(self, step: TestStep, step_number: int, start_time: float):
+        value = step.value
+        wait_time = int(value) if value else step.timeout
+        time.sleep(wait_time)
+
+    def _do_screenshot(self, step: TestStep, step_number: int, start_time: float):
+        ext, data = _grab_screenshot(self.driver)
+        screenshot_path = f"{SCREENSHOTS_DIR}/{self.test_id}_step_{step_number}{ext}"
+        screenshot_queue.put((screenshot_path, data))
+        return {
+            'step_number': step_number,
+            'action': step.action,
+            'screenshot': screenshot_path,
+            'duration': time.time() - start_time,
+            'timestamp': datetime.fromtimestamp(start_time).isoformat(timespec='milliseconds')
         }
     
     def _capture_failure_screenshot(self, step_number: int) -> str:
         """Capture screenshot when a step fails."""
         try:
-            screenshot_path = f"{SCREENSHOTS_DIR}/{self.test_id}_step_{step_number}_FAILED.png"
-            self.driver.save_screenshot(screenshot_path)
-            logger.info(f"Failure screenshot saved: {screenshot_path}")
+            ext, data = _grab_screenshot(self.driver)
+            screenshot_path = f"{SCREENSHOTS_DIR}/{self.test_id}_step_{step_number}_FAILED{ext}"
+            screenshot_queue.put((screenshot_path, data))
+            logger.info(f"Failure screenshot queued: {screenshot_path}")
             return screenshot_path
         except Exception as e:
             logger.error(f"Failed to capture screenshot: {str(e)}")
             return None
 
+def _run_test_sync(request: TestRequest, driver: Driver, start_time: float) -> TestResult:
+    """Run the blocking Selenium portion of a test on a worker thread."""
+    executor = SeleniumExecutor(driver, request.test_id)
+
+    # Open initial URL
+    logger.info(f"Opening URL: {request.url}")
+    driver.get(request.url)
+    js_utils.wait_for_ready_state_complete(driver, 10)
+
+    # Execute all steps
+    detailed_results = []
+    steps_passed = 0
+    steps_failed = 0
+
+    for idx, step in enumerate(request.steps, 1):
+        logger.info(f"Executing step {idx}/{len(request.steps)}: {step.action}")
+        step_result = executor.execute_step(step, idx)
+        detailed_results.append(step_result)
+
+        if step_result['status'] == 'passed':
+            steps_passed += 1
+        else:
+            steps_failed += 1
+            # Optionally stop on first failure for critical paths
+            # break
+
+    # Determine overall test status
+    duration = time.time() - start_time
+    overall_status = "PASS" if steps_failed == 0 else "FAIL"
+
+    # model_construct: the fields come from trusted internal code, so
+    # skip re-validating every step dict in detailed_results
+    return TestResult.model_construct(
+        test_id=request.test_id,
+        status=overall_status,
+        duration=round(duration, 2),
+        steps_executed=len(request.steps),
+        steps_passed=steps_passed,
+        steps_failed=steps_failed,
+        timestamp=datetime.now().isoformat(),
+        detailed_results=detailed_results
+    )
+
 # ============= API ENDPOINTS =============
 
 @app.get("/")
@@ -209,7 +513,7 @@ def health_check():
         "active_sessions": len(active_drivers)
     }
 
-@app.post("/execute-test", response_model=TestResult)
+@app.post("/execute-test")
 async def execute_test(request: TestRequest, background_tasks: BackgroundTasks):
     """
     Execute a test with atomic step execution.
@@ -217,72 +521,33 @@ async def execute_test(request: TestRequest, background_tasks: BackgroundTasks):
     Results are sent back to n8n webhook if provided.
     """
     start_time = time.time()
+    session_id = str(uuid.uuid4())
     driver = None
-    
+    driver_ok = True
+
     try:
         logger.info(f"Starting test execution: {request.test_id}")
-        
-        # Initialize SeleniumBase driver
-        driver = Driver(
-            browser=request.browser,
-            headless=request.headless,
-            uc=True,  # Use undetected-chromedriver
-            page_load_strategy="normal"
-        )
-        
-        # Store driver for potential reuse
-        session_id = str(uuid.uuid4())
+
+        # Check a pre-warmed driver out of the pool
+        driver = await _acquire_driver(request.browser, request.headless)
+
+        # Track the in-flight session
         active_drivers[session_id] = driver
-        
-        # Create executor
-        executor = SeleniumExecutor(driver, request.test_id)
-        
-        # Open initial URL
-        logger.info(f"Opening URL: {request.url}")
-        driver.get(request.url)
-#         driver.wait_for_ready_state_complete()
-        
-        # Execute all steps
-        detailed_results = []
-        steps_passed = 0
-        steps_failed = 0
-        
-        for idx, step in enumerate(request.steps, 1):
-            logger.info(f"Executing step {idx}/{len(request.steps)}: {step.action}")
-            step_result = executor.execute_step(step, idx)
-            detailed_results.append(step_result)
-            
-            if step_result['status'] == 'passed':
-                steps_passed += 1
-            else:
-                steps_failed += 1
-                # Optionally stop on first failure for critical paths
-                # break
-        
-        # Determine overall test status
-        duration = time.time() - start_time
-        overall_status = "PASS" if steps_failed == 0 else "FAIL"
-        
-        result = TestResult(
-            test_id=request.test_id,
-            status=overall_status,
-            duration=round(duration, 2),
-            steps_executed=len(request.steps),
-            steps_passed=steps_passed,
-            steps_failed=steps_failed,
-            timestamp=datetime.now().isoformat(),
-            detailed_results=detailed_results
-        )
-        
+
+        # Run the blocking Selenium work off the event loop
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(test_executor, _run_test_sync, request, driver, start_time)
+
         # Send webhook callback to n8n if provided
         if request.webhook_url:
-            background_tasks.add_task(send_webhook, request.webhook_url, result.dict())
-        
-        logger.info(f"Test completed: {request.test_id} - Status: {overall_status}")
+            background_tasks.add_task(send_webhook, request.webhook_url, result.model_dump_json().encode())
+
+        logger.info(f"Test completed: {request.test_id} - Status: {result.status}")
         return result
         
     except Exception as e:
         duration = time.time() - start_time
+        driver_ok = False
         error_msg = f"{type(e).__name__}: {str(e)}"
         logger.error(f"Test execution failed: {error_msg}")
         logger.error(traceback.format_exc())
@@ -291,12 +556,13 @@ async def execute_test(request: TestRequest, background_tasks: BackgroundTasks):
         screenshot_path = None
         if driver:
             try:
-                screenshot_path = f"{SCREENSHOTS_DIR}/{request.test_id}_ERROR.png"
-                driver.save_screenshot(screenshot_path)
+                ext, data = await asyncio.to_thread(_grab_screenshot, driver)
+                screenshot_path = f"{SCREENSHOTS_DIR}/{request.test_id}_ERROR{ext}"
+                screenshot_queue.put((screenshot_path, data))
             except:
                 pass
         
-        result = TestResult(
+        result = TestResult.model_construct(
             test_id=request.test_id,
             status="ERROR",
             duration=round(duration, 2),
@@ -310,26 +576,31 @@ async def execute_test(request: TestRequest, background_tasks: BackgroundTasks):
         )
         
         if request.webhook_url:
-            background_tasks.add_task(send_webhook, request.webhook_url, result.dict())
-        
+            background_tasks.add_task(send_webhook, request.webhook_url, result.model_dump_json().encode())
+
         return result
         
     finally:
-        # Cleanup driver
+        # Return the driver to the pool (or quit it if the test errored)
         if driver:
+            active_drivers.pop(session_id, None)
             try:
-                driver.quit()
-                # Remove from active sessions
-                for sid, d in list(active_drivers.items()):
-                    if d == driver:
-                        del active_drivers[sid]
+                await _release_driver(driver, request.browser, request.headless, healthy=driver_ok)
             except Exception as e:
-                logger.error(f"Error closing driver: {str(e)}")
+                logger.error(f"Error releasing driver: {str(e)}")
 
-def send_webhook(webhook_url: str, data: Dict):
-    """Send test results to n8n webhook."""
+async def send_webhook(webhook_url: str, body):
+    """Send test results to n8n webhook.
+
+    Accepts pre-serialized bytes (the common path) or a plain dict,
+    which is encoded with orjson rather than stdlib json.
+    """
     try:
-        response = requests.post(webhook_url, json=data, timeout=10)
+        if not isinstance(body, (bytes, bytearray)):
+            body = orjson.dumps(body)
+        response = await http_client.post(
+            webhook_url, content=body, headers={"Content-Type": "application/json"}
+        )
         response.raise_for_status()
         logger.info(f"Webhook sent successfully to {webhook_url}")
     except Exception as e:
@@ -339,10 +610,16 @@ def send_webhook(webhook_url: str, data: Dict):
 
 if __name__ == "__main__":
     import uvicorn
+    # uvloop/httptools come from the uvicorn[standard] extra; auto-reload
+    # (and its file watcher) only runs when ENV=dev
+    dev_mode = os.getenv("ENV") == "dev"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if dev_mode else int(os.getenv("WORKERS", "2")),
+        reload=dev_mode,
         log_level="info"
     )